@@ -1,53 +1,47 @@
+import importlib
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from services.auth.service import auth_router
-from services.user.service import user_router, stats_router
-from services.feed.service import feed_router
-from services.challenge.service import challenge_router
-from services.session.service import session_router
-from services.ai.service import ai_router
-from services.s3.router import s3_router
-from infra.mongo import connect_to_mongo, close_mongo_connection
+from fastapi.responses import ORJSONResponse
+from infra.mongo import connect_to_mongo, close_mongo_connection, create_indexes
 
-app = FastAPI()
+# (module, router) pairs; set ENABLE_<ROUTER>=0 (or false) to skip importing and mounting one
+ROUTERS = [
+    ("services.auth.service", "auth_router"),
+    ("services.user.service", "user_router"),
+    ("services.user.service", "stats_router"),
+    ("services.feed.service", "feed_router"),
+    ("services.challenge.service", "challenge_router"),
+    ("services.session.service", "session_router"),
+    ("services.ai.service", "ai_router"),
+    ("services.s3.router", "s3_router"),
+]
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await connect_to_mongo()
+    await create_indexes()
+    yield
+    await close_mongo_connection()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Add CORS middleware for mobile web compatibility
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",  # Expo web dev server
-        "http://127.0.0.1:3000",
-        "http://localhost:8081",  # Alternative Expo port
-        "http://127.0.0.1:8081",
-        "http://localhost:19006", # Another common Expo web port
-        "http://127.0.0.1:19006",
-        "http://localhost:19000", # Expo CLI default web port
-        "http://127.0.0.1:19000",
-        # Add production domains when ready
-        # "https://yourdomain.com",
-        # "https://www.yourdomain.com",
-    ],
+    # Expo web dev servers (ports 3000, 8081, 19000, 19006) on localhost/127.0.0.1.
+    # Add production domains here when ready.
+    allow_origin_regex=r"http://(localhost|127\.0\.0\.1):(3000|8081|19000|19006)",
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=["*"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With", "X-Request-ID"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-app.include_router(auth_router)
-app.include_router(user_router)
-app.include_router(stats_router)
-app.include_router(feed_router)
-app.include_router(challenge_router)
-app.include_router(session_router)
-app.include_router(ai_router)
-app.include_router(s3_router)
-
-@app.on_event("startup")
-async def startup_event():
-    await connect_to_mongo()
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    await close_mongo_connection()
+for module_name, router_name in ROUTERS:
+    if os.getenv(f"ENABLE_{router_name.upper()}", "1").lower() not in ("0", "false"):
+        app.include_router(getattr(importlib.import_module(module_name), router_name))
 
 @app.get("/")
 def root():
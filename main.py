@@ -1,8 +1,2 @@
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-
-app = FastAPI()
- 
-@app.get("/health")
-def health_check():
-    return JSONResponse(content={"status": "ok"}) 
\ No newline at end of file
+# Single entry point kept for `uvicorn main:app`; the app lives in api/main.py
+from api.main import app
@@ -5,6 +5,7 @@ from services.auth.google_utils import verify_google_token, fetch_google_profile
 from infra.mongo import Database
 from datetime import datetime
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 from typing import Optional
 
 auth_router = APIRouter()
@@ -30,7 +31,11 @@ async def signup(data: SignupRequest):
         "lastLoginAt": now
         # All other fields can be added later
     }
-    result = await db['users'].insert_one(user_doc)
+    try:
+        result = await db['users'].insert_one(user_doc)
+    except DuplicateKeyError:
+        # A concurrent signup with the same email won the race on the unique auth.email index
+        raise HTTPException(status_code=400, detail='Email already registered')
     user_id = str(result.inserted_id)
     token = create_access_token({"user_id": user_id, "email": data.email})
     return {'message': 'Signup successful', 'user_id': user_id, 'access_token': token, 'token_type': 'bearer'}
@@ -100,10 +105,14 @@ async def google_sign_in(data: GoogleSignInRequest):
                 if profile_data.get('location'):
                     update_fields["profile.location"] = profile_data['location']
             
-            await db['users'].update_one(
-                {"_id": existing_user['_id']},
-                {"$set": update_fields}
-            )
+            # Matched on providerId while another account already holds this email
+            try:
+                await db['users'].update_one(
+                    {"_id": existing_user['_id']},
+                    {"$set": update_fields}
+                )
+            except DuplicateKeyError:
+                raise HTTPException(status_code=400, detail='Email already registered')
             
         else:
             # Create new user
@@ -131,7 +140,10 @@ async def google_sign_in(data: GoogleSignInRequest):
                 "updatedAt": now
             }
             
-            result = await db['users'].insert_one(user_doc)
+            try:
+                result = await db['users'].insert_one(user_doc)
+            except DuplicateKeyError:
+                raise HTTPException(status_code=400, detail='Email already registered')
             user_id = str(result.inserted_id)
         
         # Generate JWT token
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Body
 from services.s3.service import s3_service, generate_session_video_key, generate_thumbnail_key
 from services.s3.models import VideoUploadRequest, VideoUploadResponse, ThumbnailUploadRequest, ThumbnailUploadResponse
@@ -7,6 +8,15 @@ from bson import ObjectId
 
 s3_router = APIRouter()
 
+# Top-level prefixes under which user-owned files are stored (see generate_*_key)
+USER_FILE_PREFIXES = ("sessions", "thumbnails")
+
+def is_user_file_key(file_key: str, user_id: str) -> bool:
+    """
+    Check that a file key lives under one of the user's own prefixes
+    """
+    return file_key.startswith(tuple(f"{prefix}/{user_id}/" for prefix in USER_FILE_PREFIXES))
+
 @s3_router.post('/api/s3/upload/video', response_model=VideoUploadResponse)
 async def get_video_upload_url(
     request: VideoUploadRequest = Body(...),
@@ -20,7 +30,7 @@ async def get_video_upload_url(
     session = await db['dance_sessions'].find_one({
         '_id': ObjectId(request.session_id),
         'userId': ObjectId(user_id)
-    })
+    }, {'_id': 1})
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found or not owned by user")
@@ -62,7 +72,7 @@ async def get_thumbnail_upload_url(
     session = await db['dance_sessions'].find_one({
         '_id': ObjectId(request.session_id),
         'userId': ObjectId(user_id)
-    })
+    }, {'_id': 1})
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found or not owned by user")
@@ -100,10 +110,11 @@ async def delete_file(
     Delete a file from S3 (only if it belongs to the user)
     """
     # Basic validation - ensure the file key belongs to the user
-    if not file_key.startswith(f"sessions/{user_id}/") and not file_key.startswith(f"thumbnails/{user_id}/"):
+    if not is_user_file_key(file_key, user_id):
         raise HTTPException(status_code=403, detail="Access denied")
     
-    success = s3_service.delete_file(file_key)
+    # boto3 is blocking; keep the S3 round-trip off the event loop
+    success = await asyncio.to_thread(s3_service.delete_file, file_key)
     if success:
         return {"message": "File deleted successfully"}
     else:
@@ -118,7 +129,7 @@ async def get_file_url(
     Get a presigned download URL for a file
     """
     # Basic validation - ensure the file key belongs to the user
-    if not file_key.startswith(f"sessions/{user_id}/") and not file_key.startswith(f"thumbnails/{user_id}/"):
+    if not is_user_file_key(file_key, user_id):
         raise HTTPException(status_code=403, detail="Access denied")
     
     try:
@@ -1,5 +1,6 @@
 import boto3
 import os
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from fastapi import HTTPException
 from datetime import datetime, timedelta
@@ -13,10 +14,12 @@ class S3Service:
             aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
             aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
             region_name=os.getenv('AWS_REGION'),
-            config=boto3.session.Config(
+            config=Config(
                 connect_timeout=60,
                 read_timeout=300,
-                retries={'max_attempts': 3}
+                retries={'max_attempts': 3, 'mode': 'standard'},
+                tcp_keepalive=True,
+                s3={'addressing_style': 'virtual'}
             )
         )
         self.bucket_name = os.getenv('S3_BUCKET_NAME')
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Body, Path
 from services.session.models import SessionStartRequest, SessionCompleteRequest, SessionResponse
 from infra.mongo import Database
@@ -7,6 +8,17 @@ from services.user.service import get_current_user_id
 
 session_router = APIRouter()
 
+# Only the user fields denormalized into userProfile
+USER_PROFILE_PROJECTION = {
+    'profile.displayName': 1,
+    'profile.avatarUrl': 1,
+    'profile.location': 1,
+    'isPro': 1
+}
+
+# The fields exposed by SessionResponse (_id is always returned)
+SESSION_DETAIL_PROJECTION = {field: 1 for field in SessionResponse.model_fields if field != 'id'}
+
 @session_router.get('/session/health')
 def session_health():
     return {"status": "session service ok"}
@@ -20,8 +32,18 @@ async def start_session(
     now = datetime.utcnow()
     today = now.strftime('%Y-%m-%d')
     
-    # Fetch user info for denormalization
-    user = await db['users'].find_one({'_id': ObjectId(user_id)})
+    # Fetch user info for denormalization and check if user already had a session today,
+    # issuing both independent lookups concurrently
+    user, existing_session_today = await asyncio.gather(
+        db['users'].find_one({'_id': ObjectId(user_id)}, USER_PROFILE_PROJECTION),
+        db['dance_sessions'].find_one({
+            "userId": ObjectId(user_id),
+            "startTime": {
+                "$gte": datetime.strptime(today, '%Y-%m-%d'),
+                "$lt": datetime.strptime(today, '%Y-%m-%d') + timedelta(days=1)
+            }
+        }, {'_id': 1})
+    )
     if not user:
         raise HTTPException(status_code=404, detail='User not found')
     profile = user.get('profile', {})
@@ -32,18 +54,9 @@ async def start_session(
         'location': profile.get('location', {}).get('city', '')
     }
     
-    # Check if user already had a session today
-    existing_session_today = await db['dance_sessions'].find_one({
-        "userId": ObjectId(user_id),
-        "startTime": {
-            "$gte": datetime.strptime(today, '%Y-%m-%d'),
-            "$lt": datetime.strptime(today, '%Y-%m-%d') + timedelta(days=1)
-        }
-    })
-    
     # Update streaks and daily activity if this is first session of the day
     if not existing_session_today:
-        await update_user_streaks_and_activity(db, user_id, today)
+        await update_user_streaks_and_activity(db, user_id, today, now)
     
     session_doc = {
         "userId": ObjectId(user_id),
@@ -72,7 +85,7 @@ async def start_session(
     result = await db['dance_sessions'].insert_one(session_doc)
     return {"sessionId": str(result.inserted_id)}
 
-async def update_user_streaks_and_activity(db, user_id, today):
+async def update_user_streaks_and_activity(db, user_id, today, now):
     user_stats = await db['user_stats'].find_one({'_id': ObjectId(user_id)}) or {}
     
     last_active_date = user_stats.get('lastActiveDate')
@@ -130,7 +143,7 @@ async def update_user_streaks_and_activity(db, user_id, today):
                 'currentStreakDays': current_streak,
                 'maxStreakDays': max_streak,
                 'weeklyActivity': weekly_activity,
-                'updatedAt': datetime.utcnow()
+                'updatedAt': now
             },
             '$inc': {'totalSessions': 1}
         },
@@ -145,47 +158,31 @@ async def complete_session(
     db = Database.get_database()
     session_id = data.sessionId
     now = datetime.utcnow()
-    update_fields = {
-        "endTime": data.endTime,
-        "durationMinutes": data.durationMinutes,
-        "caloriesBurned": data.caloriesBurned,
-        "videoURL": data.videoURL,
-        "videoFileKey": data.videoFileKey,
-        "thumbnailURL": data.thumbnailURL,
-        "thumbnailFileKey": data.thumbnailFileKey,
-        "score": data.score,
-        "stars": data.stars,
-        "rating": data.rating,
-        "highlightText": data.highlightText,
-        "tags": data.tags,
-        "status": "completed",
-        "updatedAt": now
-    }
-    # Remove None fields
-    update_fields = {k: v for k, v in update_fields.items() if v is not None}
-    result = await db['dance_sessions'].update_one(
+    # Remove None fields so they don't overwrite stored values
+    update_fields = data.model_dump(exclude={'sessionId'}, exclude_none=True)
+    update_fields["status"] = "completed"
+    update_fields["updatedAt"] = now
+    # Complete the session and read back its style (for mostPlayedStyle) in one round-trip
+    session = await db['dance_sessions'].find_one_and_update(
         {"_id": ObjectId(session_id), "userId": ObjectId(user_id)},
-        {"$set": update_fields}
+        {"$set": update_fields},
+        projection={'style': 1}
     )
-    if result.matched_count == 0:
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found or not owned by user")
     
     # Update user stats with session data
-    await update_user_stats_from_session(db, user_id, data)
+    await update_user_stats_from_session(db, user_id, data, session.get('style', ''), now)
     
     return {"message": "Session completed"}
 
-async def update_user_stats_from_session(db, user_id, session_data):
+async def update_user_stats_from_session(db, user_id, session_data, style, now):
     """Update user stats based on completed session data"""
-    # Get current session to extract style for mostPlayedStyle logic
-    session = await db['dance_sessions'].find_one({"_id": ObjectId(session_data.sessionId)})
-    style = session.get('style', '') if session else ''
-    
     # Prepare stats update
     stats_update = {
         '$inc': {},
         '$set': {
-            'updatedAt': datetime.utcnow()
+            'updatedAt': now
         }
     }
     
@@ -229,7 +226,7 @@ async def get_public_feed(style: str = None, location: str = None, skip: int = 0
     sessions = await db['dance_sessions'].find(query).sort("createdAt", -1).skip(skip).limit(limit).to_list(length=limit)
     user_ids = list({s['userId'] for s in sessions})
     # Fetch all relevant users in one query
-    users = await db['users'].find({"_id": {"$in": [ObjectId(uid) for uid in user_ids]}}).to_list(len(user_ids))
+    users = await db['users'].find({"_id": {"$in": [ObjectId(uid) for uid in user_ids]}}, USER_PROFILE_PROJECTION).to_list()
     user_map = {str(u['_id']): u for u in users}
     for s in sessions:
         s['_id'] = str(s['_id'])
@@ -251,6 +248,27 @@ async def get_public_feed(style: str = None, location: str = None, skip: int = 0
         s.setdefault('commentsCount', 0)
     return sessions 
 
+@session_router.get('/api/sessions/{session_id}')
+async def get_my_session(
+    session_id: str = Path(...),
+    user_id: str = Depends(get_current_user_id)
+):
+    if not ObjectId.is_valid(session_id):
+        raise HTTPException(status_code=404, detail="Session not found or not owned by user")
+    db = Database.get_database()
+    # Direct _id lookup instead of scanning the user's whole session list
+    session = await db['dance_sessions'].find_one(
+        {"_id": ObjectId(session_id), "userId": ObjectId(user_id)},
+        SESSION_DETAIL_PROJECTION
+    )
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found or not owned by user")
+    session['_id'] = str(session['_id'])
+    session['userId'] = str(session['userId'])
+    if session.get('inspirationSessionId'):
+        session['inspirationSessionId'] = str(session['inspirationSessionId'])
+    return session
+
 @session_router.post('/api/sessions/{session_id}/like')
 async def like_session(
     session_id: str = Path(...),
@@ -259,15 +277,14 @@ async def like_session(
     db = Database.get_database()
     session_obj_id = ObjectId(session_id)
     user_obj_id = ObjectId(user_id)
-    # Check if already liked
-    existing = await db['session_likes'].find_one({"sessionId": session_obj_id, "userId": user_obj_id})
-    if existing:
+    # Insert the like only if it doesn't exist yet; the upsert result tells us whether it was new
+    result = await db['session_likes'].update_one(
+        {"sessionId": session_obj_id, "userId": user_obj_id},
+        {"$setOnInsert": {"createdAt": datetime.utcnow()}},
+        upsert=True
+    )
+    if result.upserted_id is None:
         return {"message": "Already liked"}
-    await db['session_likes'].insert_one({
-        "sessionId": session_obj_id,
-        "userId": user_obj_id,
-        "createdAt": datetime.utcnow()
-    })
     await db['dance_sessions'].update_one({"_id": session_obj_id}, {"$inc": {"likesCount": 1}})
     return {"message": "Session liked"}
 
@@ -295,7 +312,7 @@ async def get_session_likers(
     session_obj_id = ObjectId(session_id)
     likes = await db['session_likes'].find({"sessionId": session_obj_id}).skip(skip).limit(limit).to_list(length=limit)
     user_ids = [like['userId'] for like in likes]
-    users = await db['users'].find({"_id": {"$in": user_ids}}).to_list(len(user_ids))
+    users = await db['users'].find({"_id": {"$in": user_ids}}, USER_PROFILE_PROJECTION).to_list()
     user_map = {u['_id']: u for u in users}
     result = []
     for like in likes:
@@ -11,13 +11,13 @@ class Location(BaseModel):
     geo: Optional[GeoPoint]
 
 class UserProfileUpdate(BaseModel):
-    username: Optional[str]
-    displayName: Optional[str]
-    avatarUrl: Optional[str]
-    bio: Optional[str]
-    gender: Optional[str]
-    birthYear: Optional[int]
-    location: Optional[Location]
+    username: Optional[str] = None
+    displayName: Optional[str] = None
+    avatarUrl: Optional[str] = None
+    bio: Optional[str] = None
+    gender: Optional[str] = None
+    birthYear: Optional[int] = None
+    location: Optional[Location] = None
 
 class GoogleUserProfile(BaseModel):
     username: Optional[str]
@@ -2,17 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, status, Header, Body
 from services.user.models import UserProfileUpdate, UserStatsUpdateRequest, UserStatsResponse
 from infra.mongo import Database
 from datetime import datetime
-from jose import jwt, JWTError
+from jose import JWTError
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 from typing import List
 from pydantic import BaseModel
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-JWT_SECRET = os.getenv("JWT_SECRET", "supersecretkey123")
-JWT_ALGORITHM = "HS256"
+from services.auth.utils import decode_access_token
 
 user_router = APIRouter()
 
@@ -21,7 +16,7 @@ def get_current_user_id(authorization: str = Header(...)):
         raise HTTPException(status_code=401, detail="Invalid authorization header")
     token = authorization.split(" ", 1)[1]
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = decode_access_token(token)
         user_id = payload.get("user_id")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token")
@@ -51,14 +46,26 @@ async def update_profile(
     user_id: str = Depends(get_current_user_id)
 ):
     db = Database.get_database()
-    update_fields = {f"profile.{k}": v for k, v in profile.dict(exclude_unset=True).items()}
+    # Nothing was sent, so skip the write and only confirm the user still exists
+    if not profile.model_fields_set:
+        if not await db["users"].find_one({"_id": ObjectId(user_id)}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="User not found")
+        return {"status": "success"}
+    update_fields = {f"profile.{k}": v for k, v in profile.model_dump(exclude_unset=True).items()}
     update_fields["updatedAt"] = datetime.utcnow()
-    # Unique username validation
+    # Unique username validation: the pre-check catches the common case even if the index is
+    # missing, and the profile.username unique index catches concurrent updates that race it
     if profile.username:
-        existing = await db["users"].find_one({"profile.username": profile.username, "_id": {"$ne": ObjectId(user_id)}})
+        existing = await db["users"].find_one(
+            {"profile.username": profile.username, "_id": {"$ne": ObjectId(user_id)}},
+            {"_id": 1}
+        )
         if existing:
             raise HTTPException(status_code=409, detail="Username already taken")
-    result = await db["users"].update_one({"_id": ObjectId(user_id)}, {"$set": update_fields})
+    try:
+        result = await db["users"].update_one({"_id": ObjectId(user_id)}, {"$set": update_fields})
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Username already taken")
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
     return {"status": "success"} 
@@ -133,19 +140,19 @@ async def get_activity_heatmap(
     today = datetime.now().date()
     start_date = today - timedelta(days=days-1)
     
-    # Query sessions in the date range to get calories per day
-    sessions = await db['dance_sessions'].find({
+    # Query sessions in the date range, fetching only the fields needed for calories per day
+    sessions = db['dance_sessions'].find({
         "userId": ObjectId(user_id),
         "status": "completed",
         "startTime": {
             "$gte": datetime.combine(start_date, datetime.min.time()),
             "$lt": datetime.combine(today + timedelta(days=1), datetime.min.time())
         }
-    }).to_list(1000)
+    }, {"startTime": 1, "caloriesBurned": 1, "_id": 0}).limit(1000)
     
     # Calculate calories per day
     calories_per_day = {}
-    for session in sessions:
+    async for session in sessions:
         session_date = session['startTime'].date().strftime('%Y-%m-%d')
         calories = session.get('caloriesBurned', 0) or 0
         calories_per_day[session_date] = calories_per_day.get(session_date, 0) + calories